@@ -4,27 +4,23 @@ Inicializa la aplicación y carga la ventana principal.
 """
 
 import sys
-from pathlib import Path
 
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt
 
-# Agregar el directorio src al path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 # Importar componentes del módulo Forward
-from views.forward_view import ForwardView
-from views.settings_view import SettingsView
-from views.main_window import MainWindow
-from controllers.forward_controller import ForwardController
-from controllers.settings_controller import SettingsController
-from models.forward_data_model import ForwardDataModel
-from models.simulations_model import SimulationsModel
-from models.settings_model import SettingsModel
-from services.forward_pricing_service import ForwardPricingService
-from services.exposure_service import ExposureService
-from services.client_service import ClientService
-from utils.signals import AppSignals
+from src.views.forward_view import ForwardView
+from src.views.settings_view import SettingsView
+from src.views.main_window import MainWindow
+from src.controllers.forward_controller import ForwardController
+from src.controllers.settings_controller import SettingsController
+from src.models.forward_data_model import ForwardDataModel
+from src.models.simulations_model import SimulationsModel
+from src.models.settings_model import SettingsModel
+from src.services.forward_pricing_service import ForwardPricingService
+from src.services.exposure_service import ExposureService
+from src.services.client_service import ClientService
+from src.utils.signals import AppSignals
 
 
 class SimuladorForwardApp:
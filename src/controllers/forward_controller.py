@@ -720,10 +720,9 @@ class ForwardController:
             import sys
             from pathlib import Path
             sys.path.insert(0, str(Path(__file__).parent.parent.parent / "data"))
-            sys.path.insert(0, str(Path(__file__).parent.parent))
             
             from data.csv_415_loader import Csv415Loader
-            from services.forward_415_processor import Forward415Processor
+            from src.services.forward_415_processor import Forward415Processor
             import numpy as np
             
             # 1. Cargar operaciones vigentes
@@ -100,10 +100,9 @@ class SettingsController(QObject):
         
         print("[SettingsController] Conectando señales...")
         
-        # Conectar cambios de Parámetros Generales (TRMs y Patrimonio)
-        self._view.trm_cop_usd.textChanged.connect(self._model.set_trm_cop_usd)
-        self._view.trm_cop_eur.textChanged.connect(self._model.set_trm_cop_eur)
-        self._view.lePatrimonioTecCOP.textChanged.connect(self._model.set_patrimonio_tec_cop)
+        # Conectar cambios de Parámetros Generales (TRMs y Patrimonio).
+        # La vista agrupa las teclas y avisa una vez por ráfaga de edición.
+        self._view.parametros_generales_changed.connect(self._on_parametros_generales_changed)
         
         # Conectar señal de modelo a vista (para actualización desde código)
         self._model.patrimonioTecCopChanged.connect(self._on_patrimonio_changed)
@@ -118,13 +117,24 @@ class SettingsController(QObject):
         # Conectar señal de cambio en contrapartes para refrescar la tabla al cargar CSV
         self._model.lineasCreditoChanged.connect(self._on_lineas_credito_loaded)
         
-        print("   [OK] trm_cop_usd.textChanged -> model.set_trm_cop_usd()")
-        print("   [OK] trm_cop_eur.textChanged -> model.set_trm_cop_eur()")
-        print("   [OK] lePatrimonioTecCOP.textChanged -> model.set_patrimonio_tec_cop()")
+        print("   [OK] parametros_generales_changed -> _on_parametros_generales_changed()")
         print("   [OK] patrimonioTecCopChanged -> _on_patrimonio_changed()")
         print("   [OK] Parametros normativos: valores fijos (sin conexiones)")
         print("   [OK] lineasCreditoChanged -> _on_lineas_credito_loaded()")
     
+    def _on_parametros_generales_changed(self) -> None:
+        """
+        Propaga al modelo los valores actuales de TRMs y Patrimonio.
+        Los setters del modelo ignoran los valores que no cambiaron.
+        """
+        if not self._model or not self._view:
+            return
+        
+        # Quitar separadores de miles por si el campo ya fue formateado al perder el foco
+        self._model.set_trm_cop_usd(self._view.trm_cop_usd.text().replace(",", ""))
+        self._model.set_trm_cop_eur(self._view.trm_cop_eur.text().replace(",", ""))
+        self._model.set_patrimonio_tec_cop(self._view.lePatrimonioTecCOP.text().replace(",", ""))
+    
     def _on_lineas_credito_loaded(self) -> None:
         """
         Callback que se ejecuta cuando se cargan/actualizan las contrapartes.
@@ -160,7 +170,8 @@ class SettingsController(QObject):
             # Evitar bucles: solo actualizar si el texto no coincide con el valor
             cur = self._view.lePatrimonioTecCOP.text()
             try:
-                cur_f = float(cur)
+                # El campo puede estar ya formateado con separador de miles (FocusOut)
+                cur_f = float(cur.replace(",", ""))
             except (ValueError, TypeError):
                 cur_f = None
             
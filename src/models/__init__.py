@@ -4,11 +4,12 @@ Módulo de modelos del Simulador Forward.
 
 from .forward_data_model import ForwardDataModel
 from .simulations_model import SimulationsModel
-from .qt import OperationsTableModel, SimulationsTableModel
+from .qt import OperationsTableModel, SimulationsTableModel, CounterpartiesTableModel
 
 __all__ = [
     'ForwardDataModel',
     'SimulationsModel',
     'OperationsTableModel',
-    'SimulationsTableModel'
+    'SimulationsTableModel',
+    'CounterpartiesTableModel'
 ]
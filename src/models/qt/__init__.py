@@ -4,9 +4,11 @@ Modelos de tabla Qt para el módulo Forward.
 
 from .operations_table_model import OperationsTableModel
 from .simulations_table_model import SimulationsTableModel
+from .counterparties_table_model import CounterpartiesTableModel
 
 __all__ = [
     'OperationsTableModel',
-    'SimulationsTableModel'
+    'SimulationsTableModel',
+    'CounterpartiesTableModel'
 ]
 
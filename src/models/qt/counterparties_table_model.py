@@ -0,0 +1,150 @@
+"""
+Modelo de tabla Qt para la información de contrapartes (solo lectura).
+"""
+
+from typing import Any
+import pandas as pd
+from PySide6.QtCore import QAbstractTableModel, Qt, QModelIndex
+
+
+class CounterpartiesTableModel(QAbstractTableModel):
+    """
+    Modelo de tabla Qt para la información de contrapartes (solo lectura).
+    
+    Responsabilidades:
+    - Presentar el catálogo de contrapartes cargado desde CSV en QTableView
+    - Guardar los datos por columnas (arrays NumPy) en lugar de un ítem por celda
+    - Entregar el texto de cada celda bajo demanda (solo filas visibles)
+    """
+    
+    # Headers de columnas (mismos nombres que en el CSV)
+    HEADERS = [
+        "NIT",
+        "Contraparte",
+        "Grupo Conectado de Contrapartes"
+    ]
+    
+    def __init__(self, parent=None):
+        """
+        Inicializa el modelo de tabla de contrapartes.
+        
+        Args:
+            parent: Widget padre
+        """
+        super().__init__(parent)
+        
+        # Columnas visibles y sus datos (un array por columna)
+        self._headers = list(self.HEADERS)
+        self._cols = []
+        self._n_rows = 0
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """
+        Retorna el número de filas (contrapartes).
+        
+        Args:
+            parent: Índice padre
+        
+        Returns:
+            Cantidad de contrapartes
+        """
+        if parent.isValid():
+            return 0
+        return self._n_rows
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """
+        Retorna el número de columnas.
+        
+        Args:
+            parent: Índice padre
+        
+        Returns:
+            Cantidad de columnas
+        """
+        if parent.isValid():
+            return 0
+        return len(self._headers)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """
+        Retorna el dato para una celda específica.
+        
+        Args:
+            index: Índice de la celda
+            role: Rol de los datos
+        
+        Returns:
+            Texto de la celda para DisplayRole, None en otro caso
+        """
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        
+        row, col = index.row(), index.column()
+        if not (0 <= row < self._n_rows and 0 <= col < len(self._cols)):
+            return None
+        
+        return self._cols[col][row]
+    
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.DisplayRole) -> Any:
+        """
+        Retorna datos del header.
+        
+        Args:
+            section: Número de columna/fila
+            orientation: Horizontal o Vertical
+            role: Rol de los datos
+        
+        Returns:
+            Nombre de columna o número de fila
+        """
+        if role == Qt.DisplayRole:
+            if orientation == Qt.Horizontal:
+                if 0 <= section < len(self._headers):
+                    return self._headers[section]
+            elif orientation == Qt.Vertical:
+                return str(section + 1)  # Número de fila (1-based)
+        
+        return None
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        """
+        Retorna flags de la celda (solo lectura).
+        
+        Args:
+            index: Índice de la celda
+        
+        Returns:
+            Flags indicando seleccionable pero no editable
+        """
+        if not index.isValid():
+            return Qt.NoItemFlags
+        
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+    
+    def set_dataframe(self, df: pd.DataFrame) -> None:
+        """
+        Establece las contrapartes a mostrar.
+        
+        Solo se muestran las columnas de HEADERS presentes en el DataFrame.
+        Cada columna se extrae una vez como array de texto; los valores nulos
+        se muestran vacíos. La columna pasa a object antes de fillna para
+        admitir columnas categóricas (el grupo conectado en SettingsModel).
+        
+        Args:
+            df: DataFrame con NIT, Contraparte y Grupo Conectado de Contrapartes
+        """
+        self.beginResetModel()
+        if df is None or df.empty:
+            self._headers = list(self.HEADERS)
+            self._cols = []
+            self._n_rows = 0
+        else:
+            self._headers = [col for col in self.HEADERS if col in df.columns]
+            self._cols = [
+                df[col].astype(object).fillna("").astype(str).to_numpy(dtype=object)
+                for col in self._headers
+            ]
+            self._n_rows = len(df)
+        self.endResetModel()
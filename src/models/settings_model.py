@@ -5,9 +5,12 @@ Gestiona la configuración y parámetros de la aplicación con señales Qt para
 
 from PySide6.QtCore import QObject, Signal
 from typing import Optional, Dict, Any, List
+import logging
 import pandas as pd
 from src.utils.ids import normalize_nit
 
+_log = logging.getLogger(__name__)
+
 
 class SettingsModel(QObject):
     """
@@ -51,8 +54,10 @@ class SettingsModel(QObject):
         
         # Información de contrapartes
         self._lineas_credito_df = pd.DataFrame()  # DataFrame con contrapartes cargadas
+        self._grupo_por_nit: Dict[str, Optional[str]] = {}  # NIT_norm -> grupo (primer registro)
+        self._miembros_por_grupo: Dict[str, List[Dict[str, str]]] = {}  # grupo -> contrapartes
         
-        print("[SettingsModel] Inicializado SIN valores por defecto (todos en None)")
+        _log.debug("[SettingsModel] Inicializado SIN valores por defecto (todos en None)")
     
     # === Parámetros Generales ===
     
@@ -73,9 +78,9 @@ class SettingsModel(QObject):
             self._trm_cop_usd = val
             self.trm_cop_usdChanged.emit(val)
             if val is not None:
-                print(f"[SettingsModel] TRM COP/USD actualizada: {val:,.6f}")
+                _log.debug("[SettingsModel] TRM COP/USD actualizada: %.6f", val)
             else:
-                print("[SettingsModel] TRM COP/USD limpiada (None)")
+                _log.debug("[SettingsModel] TRM COP/USD limpiada (None)")
     
     def trm_cop_usd(self) -> Optional[float]:
         """
@@ -103,9 +108,9 @@ class SettingsModel(QObject):
             self._trm_cop_eur = val
             self.trm_cop_eurChanged.emit(val)
             if val is not None:
-                print(f"[SettingsModel] TRM COP/EUR actualizada: {val:,.6f}")
+                _log.debug("[SettingsModel] TRM COP/EUR actualizada: %.6f", val)
             else:
-                print("[SettingsModel] TRM COP/EUR limpiada (None)")
+                _log.debug("[SettingsModel] TRM COP/EUR limpiada (None)")
     
     def trm_cop_eur(self) -> Optional[float]:
         """
@@ -137,9 +142,9 @@ class SettingsModel(QObject):
             self._patrimonio_tec_cop = val
             self.patrimonioTecCopChanged.emit(val)
             if val is not None:
-                print(f"[SettingsModel] Patrimonio técnico vigente actualizado: $ {val:,.2f} COP")
+                _log.debug("[SettingsModel] Patrimonio técnico vigente actualizado: $ %.2f COP", val)
             else:
-                print("[SettingsModel] Patrimonio técnico vigente limpiado (None)")
+                _log.debug("[SettingsModel] Patrimonio técnico vigente limpiado (None)")
     
     def patrimonio_tec_cop(self) -> Optional[float]:
         """
@@ -205,7 +210,7 @@ class SettingsModel(QObject):
         if v != self._colchon_seguridad:
             self._colchon_seguridad = v
             self.colchonSeguridadChanged.emit(v)
-            print(f"[SettingsModel] Colchón de seguridad actualizado: {v * 100:.1f}%")
+            _log.debug("[SettingsModel] Colchón de seguridad actualizado: %.1f%%", v * 100)
     
     def colchon_seguridad(self) -> float:
         """Obtiene el colchón de seguridad (%)."""
@@ -230,14 +235,10 @@ class SettingsModel(QObject):
         Args:
             df: DataFrame con columnas NIT, Contraparte, Grupo Conectado de Contrapartes
         """
-        df = df.copy()
-        
-        # Conservar solo columnas relevantes (ignorar extras)
+        # Conservar solo columnas relevantes (ignorar extras, completar faltantes);
+        # reindex crea el único DataFrame nuevo, sin copiar antes el original
         required_cols = ["NIT", "Contraparte", "Grupo Conectado de Contrapartes"]
-        for col in required_cols:
-            if col not in df.columns:
-                df[col] = ""
-        df = df[required_cols].copy()
+        df = df.reindex(columns=required_cols, fill_value="")
         
         # Normalizar NIT usando la función de utilidades (crear columna NIT_norm)
         if "NIT" in df.columns:
@@ -252,14 +253,46 @@ class SettingsModel(QObject):
         if "Grupo Conectado de Contrapartes" not in df.columns:
             df["Grupo Conectado de Contrapartes"] = ""
         else:
+            # Pocos grupos repetidos en muchas filas: categórica (códigos enteros)
             df["Grupo Conectado de Contrapartes"] = (
-                df["Grupo Conectado de Contrapartes"].fillna("").astype(str)
+                df["Grupo Conectado de Contrapartes"].astype(object).fillna("").astype(str).astype("category")
             )
         
         self._lineas_credito_df = df
+        self._grupo_por_nit, self._miembros_por_grupo = self._construir_indices_grupo(df)
         self.lineasCreditoChanged.emit()
         self.counterpartiesChanged.emit()
-        print(f"[SettingsModel] Contrapartes actualizadas: {len(df)} registros")
+        _log.debug("[SettingsModel] Contrapartes actualizadas: %d registros", len(df))
+    
+    @staticmethod
+    def _construir_indices_grupo(df: pd.DataFrame):
+        """
+        Construye en una sola pasada los índices de consulta de grupos conectados.
+        
+        Args:
+            df: DataFrame de contrapartes ya normalizado (con NIT_norm)
+            
+        Returns:
+            Tupla (grupo_por_nit, miembros_por_grupo):
+            - grupo_por_nit: NIT_norm -> grupo (sin espacios) o None, del primer registro
+            - miembros_por_grupo: grupo -> lista de {nit, nombre, grupo}
+        """
+        grupo_por_nit: Dict[str, Optional[str]] = {}
+        miembros_por_grupo: Dict[str, List[Dict[str, str]]] = {}
+        
+        for nit, nombre, grupo in zip(
+            df["NIT_norm"], df["Contraparte"], df["Grupo Conectado de Contrapartes"]
+        ):
+            grupo_limpio = grupo.strip()
+            grupo_por_nit.setdefault(nit, grupo_limpio or None)
+            if grupo_limpio:
+                miembros_por_grupo.setdefault(grupo_limpio, []).append({
+                    "nit": nit,
+                    "nombre": nombre,
+                    "grupo": grupo,
+                })
+        
+        return grupo_por_nit, miembros_por_grupo
     
     def get_linea_credito_por_nit(self, nit: str) -> Optional[Dict[str, Any]]:
         """
@@ -345,7 +378,7 @@ class SettingsModel(QObject):
             seen.add(c["nit"])
             dedup.append(c)
         
-        print(f"[SettingsModel] Catálogo de contrapartes: {len(dedup)} registros")
+        _log.debug("[SettingsModel] Catálogo de contrapartes: %d registros", len(dedup))
         return dedup
 
     # === Grupos de contrapartes ===
@@ -353,27 +386,17 @@ class SettingsModel(QObject):
     def get_group_for_nit(self, nit_norm: str) -> Optional[str]:
         """
         Devuelve el nombre del grupo conectado para un NIT normalizado.
+        Consulta el índice construido en set_lineas_credito (O(1)).
         """
-        df = getattr(self, "_lineas_credito_df", None)
-        if df is None or df.empty or not nit_norm:
-            return None
-        
-        rows = df[df["NIT_norm"] == nit_norm]
-        if rows.empty:
+        if not nit_norm:
             return None
-        
-        grupo = rows["Grupo Conectado de Contrapartes"].iloc[0]
-        grupo = str(grupo).strip() if grupo is not None else ""
-        return grupo or None
+        return self._grupo_por_nit.get(nit_norm)
     
     def get_counterparties_by_group(self, grupo: str) -> List[Dict[str, str]]:
         """
         Devuelve lista de contrapartes pertenecientes a un grupo dado.
+        Consulta el índice construido en set_lineas_credito (O(1)).
         """
-        df = getattr(self, "_lineas_credito_df", None)
-        if df is None or df.empty:
-            return []
-        
         if not grupo:
             return []
         
@@ -381,22 +404,7 @@ class SettingsModel(QObject):
         if not grupo_normalizado:
             return []
         
-        mask = df["Grupo Conectado de Contrapartes"].astype(str).str.strip() == grupo_normalizado
-        sub = df[mask]
-        if sub.empty:
-            return []
-        
-        result: List[Dict[str, str]] = []
-        for _, row in sub.iterrows():
-            nit_norm = row.get("NIT_norm")
-            if not nit_norm:
-                nit_norm = normalize_nit(row.get("NIT", ""))
-            result.append({
-                "nit": nit_norm,
-                "nombre": row.get("Contraparte", ""),
-                "grupo": row.get("Grupo Conectado de Contrapartes", ""),
-            })
-        return result
+        return list(self._miembros_por_grupo.get(grupo_normalizado, []))
     
     def get_group_members_by_nit(self, nit_norm: str) -> List[Dict[str, str]]:
         """
@@ -5,6 +5,10 @@ Utilidades para manejo de identificadores (NIT, RUT, etc).
 import re
 
 
+# Ceros a la izquierda seguidos de al menos un dígito
+_CEROS_IZQ_RE = re.compile(r"^0+(?=\d)")
+
+
 def normalize_nit(nit: str | int) -> str:
     """
     Normaliza un NIT eliminando espacios, guiones y ceros a la izquierda.
@@ -26,7 +30,8 @@ def normalize_nit(nit: str | int) -> str:
     s = str(nit).strip()
     # Eliminar espacios, puntos y guiones
     s = s.replace(" ", "").replace("-", "").replace(".", "")
-    # Quitar ceros a la izquierda (si aplica)
-    s = re.sub(r"^0+(?=\d)", "", s)
+    # Quitar ceros a la izquierda (si aplica; la mayoría de NITs no los tiene)
+    if s[:1] == "0":
+        s = _CEROS_IZQ_RE.sub("", s)
     return s
 
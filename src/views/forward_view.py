@@ -3,6 +3,7 @@ Vista para el módulo de operaciones Forward.
 Layout visual completo con cards, tablas y toolbar.
 """
 
+import logging
 from typing import Optional, List, Dict, Any
 from datetime import date
 from PySide6.QtWidgets import (
@@ -17,6 +18,25 @@ from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from matplotlib.ticker import FuncFormatter
 
+_log = logging.getLogger(__name__)
+
+
+# Plantilla HTML del resumen de consumo que muestra update_chart()
+_CHART_TEMPLATE = """<div style='padding: 20px; text-align: center;'>
+<h3>Consumo de Línea de Crédito</h3>
+<hr>
+<p style='font-size: 12pt;'>
+    <b>Línea Total:</b> $ {linea_total:,.0f}<br><br>
+    <b style='color: blue;'>Consumo Actual:</b> $ {consumo_actual:,.0f} ({pct_actual:.1f}%)<br>
+    <b style='color: orange;'>Consumo con Simulación:</b> $ {consumo_con_sim:,.0f} ({pct_con_sim:.1f}%)<br>
+    <b style='color: green;'>Disponibilidad:</b> $ {disponibilidad:,.0f} ({pct_disp:.1f}%)<br>
+</p>
+<hr>
+<p style='font-size: 10pt; color: gray;'>
+    (Placeholder - integrar gráfica real con QtCharts)
+</p>
+</div>"""
+
 
 class ForwardView(QWidget):
     """
@@ -94,6 +114,11 @@ class ForwardView(QWidget):
         self.banner415 = None
         self.bannerIBR = None
         
+        # Último contenido pintado en el banner 415 (nombre, tamaño, fecha, estado)
+        self._last_banner_key = None
+        # Últimos valores mostrados en el resumen de consumo (update_chart)
+        self._last_chart_key = None
+        
         self._setup_ui()
         self._connect_settings_model()
     
@@ -112,29 +137,36 @@ class ForwardView(QWidget):
         else:
             print("[ForwardView] SettingsModel no proporcionado")
     
+    # Secciones de la vista en orden vertical: (atributo destino, método constructor)
+    _SECTIONS = (
+        (None, "_create_header"),               # 1. Header
+        ("banner415", "_create_banner_415"),    # 2. Banner estado 415
+        ("bannerIBR", "_create_banner_ibr"),    # 2b. Banner estado IBR
+        (None, "_create_upper_panel"),          # 3. Panel superior con 3 columnas
+        (None, "_create_lower_panel"),          # 4. Panel inferior con tablas
+    )
+    
     def _setup_ui(self):
-        """Configura la interfaz de usuario completa."""
+        """
+        Configura la interfaz de usuario completa.
+        
+        Las secciones declaradas en _SECTIONS se construyen primero y luego
+        se agregan al layout principal en una sola pasada.
+        """
+        sections = []
+        for attr, factory in self._SECTIONS:
+            widget = getattr(self, factory)()
+            if attr:
+                setattr(self, attr, widget)
+            sections.append(widget)
+        
         # Layout principal vertical
         main_layout = QVBoxLayout(self)
         main_layout.setSpacing(6)
         main_layout.setContentsMargins(15, 15, 15, 15)
         
-        # 1. Header
-        main_layout.addWidget(self._create_header())
-        
-        # 2. Banner estado 415
-        self.banner415 = self._create_banner_415()
-        main_layout.addWidget(self.banner415)
-        
-        # 2b. Banner estado IBR
-        self.bannerIBR = self._create_banner_ibr()
-        main_layout.addWidget(self.bannerIBR)
-        
-        # 3. Panel superior con 3 columnas
-        main_layout.addWidget(self._create_upper_panel())
-        
-        # 4. Panel inferior con tablas
-        main_layout.addWidget(self._create_lower_panel())
+        for widget in sections:
+            main_layout.addWidget(widget)
     
     def _create_header(self) -> QWidget:
         """Crea el header con título y botón de carga."""
@@ -488,6 +520,19 @@ class ForwardView(QWidget):
         # Añadir el canvas al layout
         card_e_layout.addWidget(self.canvas_consumo2)
         
+        # Resumen textual de consumo (lo usa update_chart): un único QLabel,
+        # sin QWidget + QVBoxLayout intermedios. Oculto mientras la gráfica
+        # de matplotlib sea la visualización principal.
+        self.chartContainer = QLabel("Gráfica pendiente")
+        self.chartContainer.setObjectName("chartContainer")
+        self.chartContainer.setAlignment(Qt.AlignCenter)
+        self.chartContainer.setStyleSheet(
+            "QLabel#chartContainer { background-color: #fafafa; border: 2px dashed #ccc; "
+            "border-radius: 4px; color: #999; }"
+        )
+        self.chartContainer.setVisible(False)
+        card_e_layout.addWidget(self.chartContainer)
+        
         card_e.setLayout(card_e_layout)
         column_layout.addWidget(card_e)
         
@@ -572,6 +617,7 @@ class ForwardView(QWidget):
         self.tblSimulaciones.setSelectionBehavior(QTableView.SelectRows)
         self.tblSimulaciones.setSelectionMode(QTableView.ExtendedSelection)
         self.tblSimulaciones.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.tblSimulaciones.verticalHeader().setVisible(False)  # Ocultar números de fila
         section_layout.addWidget(self.tblSimulaciones)
         
         return section
@@ -597,7 +643,9 @@ class ForwardView(QWidget):
         self.tblVigentes.setAlternatingRowColors(True)
         self.tblVigentes.setSortingEnabled(True)
         self.tblVigentes.setSelectionBehavior(QTableView.SelectRows)
+        self.tblVigentes.setSelectionMode(QTableView.SingleSelection)
         self.tblVigentes.setEditTriggers(QTableView.NoEditTriggers)  # Solo lectura
+        self.tblVigentes.verticalHeader().setVisible(False)
         section_layout.addWidget(self.tblVigentes)
         
         return section
@@ -983,12 +1031,18 @@ class ForwardView(QWidget):
             if isinstance(fecha_cargue, datetime):
                 fecha_str = fecha_cargue.strftime("%Y-%m-%d %H:%M")
         
+        # Evitar setText/setStyleSheet si el banner ya muestra estos mismos datos
+        key = (nombre, tamano_kb, fecha_str, estado)
+        if key == self._last_banner_key:
+            return
+        self._last_banner_key = key
+        
         # Actualizar label del banner
         banner_text = f"Archivo: {nombre} | Tamaño: {tamano_kb:.2f} KB | Fecha cargue: {fecha_str}"
         self.lblArchivo415.setText(banner_text)
         
         # Mostrar el banner
-        banner = self.findChild(QFrame, "banner415")
+        banner = self.banner415
         if banner:
             banner.setVisible(True)
             
@@ -1204,100 +1258,100 @@ class ForwardView(QWidget):
         consumo_con_sim = data.get("consumo_con_simulacion", 0)
         disponibilidad = data.get("disponibilidad", 0)
         
+        # Señales duplicadas con los mismos valores no vuelven a pintar el label
+        key = (linea_total, consumo_actual, consumo_con_sim, disponibilidad)
+        if key == self._last_chart_key:
+            return
+        self._last_chart_key = key
+        
         # Calcular porcentajes
         pct_actual = (consumo_actual / linea_total * 100) if linea_total > 0 else 0
         pct_con_sim = (consumo_con_sim / linea_total * 100) if linea_total > 0 else 0
         pct_disp = (disponibilidad / linea_total * 100) if linea_total > 0 else 0
         
-        chart_text = f"""<div style='padding: 20px; text-align: center;'>
-<h3>Consumo de Línea de Crédito</h3>
-<hr>
-<p style='font-size: 12pt;'>
-    <b>Línea Total:</b> $ {linea_total:,.0f}<br><br>
-    <b style='color: blue;'>Consumo Actual:</b> $ {consumo_actual:,.0f} ({pct_actual:.1f}%)<br>
-    <b style='color: orange;'>Consumo con Simulación:</b> $ {consumo_con_sim:,.0f} ({pct_con_sim:.1f}%)<br>
-    <b style='color: green;'>Disponibilidad:</b> $ {disponibilidad:,.0f} ({pct_disp:.1f}%)<br>
-</p>
-<hr>
-<p style='font-size: 10pt; color: gray;'>
-    (Placeholder - integrar gráfica real con QtCharts)
-</p>
-</div>"""
+        chart_text = _CHART_TEMPLATE.format(
+            linea_total=linea_total,
+            consumo_actual=consumo_actual,
+            pct_actual=pct_actual,
+            consumo_con_sim=consumo_con_sim,
+            pct_con_sim=pct_con_sim,
+            disponibilidad=disponibilidad,
+            pct_disp=pct_disp,
+        )
         
-        # Buscar el label dentro del chartContainer y actualizar su texto
-        for child in self.chartContainer.findChildren(QLabel):
-            child.setText(chart_text)
+        # chartContainer es el propio QLabel: sin recorrer el árbol de hijos
+        if self.chartContainer is not None:
+            self.chartContainer.setText(chart_text)
     
     def set_operations_table(self, model: Any) -> None:
         """
         Establece el modelo de tabla de operaciones vigentes.
         
+        Las propiedades propias de la vista (filas alternadas, ordenamiento,
+        selección) se configuran una sola vez en _create_operations_section.
+        
         Args:
             model: Instancia de OperationsTableModel
         """
-        from PySide6.QtWidgets import QHeaderView, QAbstractItemView
+        from PySide6.QtWidgets import QHeaderView
         
-        print(f"[ForwardView] set_operations_table: {model}")
+        _log.debug("[ForwardView] set_operations_table: %s", model)
         if model:
-            self.tblVigentes.setModel(model)
-            
-            # Configurar ancho proporcional uniforme para todas las columnas
-            header = self.tblVigentes.horizontalHeader()
-            header.setStretchLastSection(True)
-            header.setSectionResizeMode(QHeaderView.Stretch)  # Todas las columnas con ancho proporcional
-            
-            # Configurar tabla
-            self.tblVigentes.verticalHeader().setVisible(False)
-            self.tblVigentes.setAlternatingRowColors(True)
-            self.tblVigentes.setSortingEnabled(True)
-            self.tblVigentes.setSelectionBehavior(QAbstractItemView.SelectRows)
-            self.tblVigentes.setSelectionMode(QAbstractItemView.SingleSelection)
+            # Suspender repintado mientras se instala el modelo
+            self.tblVigentes.setUpdatesEnabled(False)
+            try:
+                self.tblVigentes.setModel(model)
+                
+                # Configurar ancho proporcional uniforme para todas las columnas
+                header = self.tblVigentes.horizontalHeader()
+                header.setStretchLastSection(True)
+                header.setSectionResizeMode(QHeaderView.Stretch)  # Todas las columnas con ancho proporcional
+            finally:
+                self.tblVigentes.setUpdatesEnabled(True)
     
     def set_simulations_table(self, model: Any) -> None:
         """
         Establece el modelo de tabla de simulaciones.
         
+        Las propiedades propias de la vista (filas alternadas, ordenamiento,
+        selección) se configuran una sola vez en _create_simulations_section.
+        
         Args:
             model: Instancia de SimulationsTableModel
         """
-        print(f"[ForwardView] set_simulations_table: {model}")
+        from PySide6.QtWidgets import QHeaderView
+        from src.views.simulations_delegates import PuntaClienteDelegate, FechaDelegate
+        
+        _log.debug("[ForwardView] set_simulations_table: %s", model)
         if model:
-            self.tblSimulaciones.setModel(model)
-            
-            # Configurar delegates personalizados
-            from src.views.simulations_delegates import PuntaClienteDelegate, FechaDelegate
-            
-            # Delegate para "Punta Cli" (columna 1)
-            punta_col_idx = model.get_column_index("Punta Cli")
-            if punta_col_idx >= 0:
-                self.tblSimulaciones.setItemDelegateForColumn(
-                    punta_col_idx, 
-                    PuntaClienteDelegate(self.tblSimulaciones)
-                )
-                print(f"   [OK] Delegate configurado para columna 'Punta Cli' (indice {punta_col_idx})")
-            
-            # Delegate para "Fec Venc" (columna 5)
-            fecha_col_idx = model.get_column_index("Fec Venc")
-            if fecha_col_idx >= 0:
-                self.tblSimulaciones.setItemDelegateForColumn(
-                    fecha_col_idx,
-                    FechaDelegate(self.tblSimulaciones)
-                )
-                print(f"   [OK] Delegate configurado para columna 'Fec Venc' (indice {fecha_col_idx})")
-            
-            # Configurar tabla con distribución uniforme de columnas
-            from PySide6.QtWidgets import QHeaderView, QAbstractItemView
-            
-            self.tblSimulaciones.setAlternatingRowColors(True)
-            self.tblSimulaciones.setSortingEnabled(True)
-            self.tblSimulaciones.setSelectionBehavior(QAbstractItemView.SelectRows)
-            
-            # Distribución uniforme de columnas
-            self.tblSimulaciones.horizontalHeader().setStretchLastSection(True)
-            self.tblSimulaciones.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-            
-            # Ocultar números de fila verticales
-            self.tblSimulaciones.verticalHeader().setVisible(False)
+            # Suspender repintado mientras se instala el modelo
+            self.tblSimulaciones.setUpdatesEnabled(False)
+            try:
+                self.tblSimulaciones.setModel(model)
+                
+                # Delegate para "Punta Cli" (columna 1)
+                punta_col_idx = model.get_column_index("Punta Cli")
+                if punta_col_idx >= 0:
+                    self.tblSimulaciones.setItemDelegateForColumn(
+                        punta_col_idx, 
+                        PuntaClienteDelegate(self.tblSimulaciones)
+                    )
+                    _log.debug("   [OK] Delegate configurado para columna 'Punta Cli' (indice %d)", punta_col_idx)
+                
+                # Delegate para "Fec Venc" (columna 5)
+                fecha_col_idx = model.get_column_index("Fec Venc")
+                if fecha_col_idx >= 0:
+                    self.tblSimulaciones.setItemDelegateForColumn(
+                        fecha_col_idx,
+                        FechaDelegate(self.tblSimulaciones)
+                    )
+                    _log.debug("   [OK] Delegate configurado para columna 'Fec Venc' (indice %d)", fecha_col_idx)
+                
+                # Distribución uniforme de columnas
+                self.tblSimulaciones.horizontalHeader().setStretchLastSection(True)
+                self.tblSimulaciones.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+            finally:
+                self.tblSimulaciones.setUpdatesEnabled(True)
     
     def update_ibr_status(
         self,
@@ -1447,5 +1501,6 @@ class ForwardView(QWidget):
             message: Mensaje a mostrar
             level: Nivel de severidad ("info", "warning", "error")
         """
-        print(f"[ForwardView] notify [{level}]: {message}")
+        log_level = {"warning": logging.WARNING, "error": logging.ERROR}.get(level, logging.INFO)
+        _log.log(log_level, "[ForwardView] notify [%s]: %s", level, message)
         # Aquí se podría usar QMessageBox o un sistema de notificaciones toast
@@ -9,13 +9,49 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 from datetime import date
-import sys
-from pathlib import Path
+import logging
 
-# Asegurar que src está en el path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.models.qt import OperationsTableModel, SimulationsTableModel
 
-from models.qt import OperationsTableModel, SimulationsTableModel
+_log = logging.getLogger(__name__)
+
+# Hoja de estilos de la ventana principal (se construye una sola vez al importar)
+_MAIN_QSS = """
+    /* Top Navigation Bar */
+    #TopBar {
+        background-color: #f8f9fa;
+        border-bottom: 2px solid #d0d0d0;
+    }
+
+    /* Botones de navegación */
+    QPushButton {
+        background-color: transparent;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 6px;
+        font-weight: 500;
+        color: #333333;
+    }
+
+    QPushButton:hover {
+        background-color: #e6e9ed;
+    }
+
+    QPushButton:checked {
+        background-color: #0078D7;
+        color: white;
+        font-weight: bold;
+    }
+
+    QPushButton:pressed {
+        background-color: #005a9e;
+    }
+
+    /* Main Content Area */
+    #MainContent {
+        background-color: white;
+    }
+"""
 
 
 class MainWindow(QMainWindow):
@@ -98,7 +134,7 @@ class MainWindow(QMainWindow):
         # Aplicar estilos
         self._apply_styles()
         
-        print("[MainWindow] UI configurada con Top Navigation Bar")
+        _log.debug("[MainWindow] UI configurada con Top Navigation Bar")
     
     def _create_top_bar(self) -> QFrame:
         """
@@ -125,7 +161,7 @@ class MainWindow(QMainWindow):
         self.btnForward.setCheckable(True)
         self.btnForward.setObjectName("btnForward")
         self.btnForward.setCursor(Qt.PointingHandCursor)
-        self.btnForward.clicked.connect(lambda: self.switch_module(0))
+        self.btnForward.clicked.connect(self._on_forward_button_clicked)
         
         # Botón: Configuraciones
         self.btnSettings = QPushButton("⚙️ Configuraciones")
@@ -133,7 +169,7 @@ class MainWindow(QMainWindow):
         self.btnSettings.setCheckable(True)
         self.btnSettings.setObjectName("btnSettings")
         self.btnSettings.setCursor(Qt.PointingHandCursor)
-        self.btnSettings.clicked.connect(lambda: self.switch_module(1))
+        self.btnSettings.clicked.connect(self._on_settings_button_clicked)
         
         # Añadir botones al layout
         top_bar_layout.addWidget(self.btnForward, alignment=Qt.AlignLeft)
@@ -142,6 +178,14 @@ class MainWindow(QMainWindow):
         
         return top_bar
     
+    def _on_forward_button_clicked(self):
+        """Handler interno para el botón Simulación Forward."""
+        self.switch_module(0)
+    
+    def _on_settings_button_clicked(self):
+        """Handler interno para el botón Configuraciones."""
+        self.switch_module(1)
+    
     def switch_module(self, index: int):
         """
         Cambia entre módulos y actualiza estado de los botones.
@@ -156,68 +200,32 @@ class MainWindow(QMainWindow):
         self.btnSettings.setChecked(index == 1)
         
         # Log del cambio
-        module_name = "Forward" if index == 0 else "Settings"
-        print(f"[MainWindow] Cambiado a módulo: {module_name}")
+        _log.debug("[MainWindow] Cambiado a módulo: %s", "Forward" if index == 0 else "Settings")
     
     def _apply_styles(self):
         """Aplica los estilos CSS a la ventana principal."""
-        self.setStyleSheet("""
-            /* Top Navigation Bar */
-            #TopBar {
-                background-color: #f8f9fa;
-                border-bottom: 2px solid #d0d0d0;
-            }
-            
-            /* Botones de navegación */
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: 500;
-                color: #333333;
-            }
-            
-            QPushButton:hover {
-                background-color: #e6e9ed;
-            }
-            
-            QPushButton:checked {
-                background-color: #0078D7;
-                color: white;
-                font-weight: bold;
-            }
-            
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-            
-            /* Main Content Area */
-            #MainContent {
-                background-color: white;
-            }
-        """)
+        self.setStyleSheet(_MAIN_QSS)
     
     def _setup_table_models(self):
         """Crea e inyecta los modelos de tabla a la vista."""
         if not self._forward_view:
             return
         
-        print("[MainWindow] Creando modelos de tabla...")
+        _log.debug("[MainWindow] Creando modelos de tabla...")
         
         # Crear modelo de operaciones vigentes (solo lectura)
         self._operations_model = OperationsTableModel()
-        print(f"   [OK] OperationsTableModel creado con {self._operations_model.rowCount()} filas")
+        _log.debug("   [OK] OperationsTableModel creado con %d filas", self._operations_model.rowCount())
         
         # Crear modelo de simulaciones (editable)
         self._simulations_model = SimulationsTableModel()
-        print(f"   [OK] SimulationsTableModel creado con {self._simulations_model.rowCount()} filas")
+        _log.debug("   [OK] SimulationsTableModel creado con %d filas", self._simulations_model.rowCount())
         
         # Conectar modelos a la vista
         self._forward_view.set_operations_table(self._operations_model)
         self._forward_view.set_simulations_table(self._simulations_model)
         
-        print("[MainWindow] Modelos de tabla conectados a la vista")
+        _log.debug("[MainWindow] Modelos de tabla conectados a la vista")
     
     def _connect_global_signals(self):
         """Conecta las señales globales a los métodos de actualización de la vista."""
@@ -236,7 +244,7 @@ class MainWindow(QMainWindow):
         # Señal: exposure_updated -> actualizar exposición y chart
         self._signals.forward_exposure_updated.connect(self._on_exposure_updated)
         
-        print("[MainWindow] Señales globales conectadas")
+        _log.debug("[MainWindow] Señales globales conectadas")
     
     # Handlers de señales globales (con datos dummy)
     
@@ -248,7 +256,7 @@ class MainWindow(QMainWindow):
             corte_415: Fecha de corte del 415
             estado_415: Estado del archivo
         """
-        print(f"[MainWindow] _on_415_loaded: corte={corte_415}, estado={estado_415}")
+        _log.debug("[MainWindow] _on_415_loaded: corte=%s, estado=%s", corte_415, estado_415)
         
         # Actualizar vista con datos dummy
         patrimonio_dummy = 50000000000.0  # 50 mil millones
@@ -272,21 +280,21 @@ class MainWindow(QMainWindow):
         Esa responsabilidad es exclusiva del ForwardController.
         MainWindow solo actúa como router de eventos.
         """
-        print(f"[MainWindow] _on_client_changed: nit={nit}")
+        _log.debug("[MainWindow] _on_client_changed: nit=%s", nit)
         
         # ❌ NO calcular ni setear límites aquí
         # ❌ NO llamar a show_client_limits() con valores dummy
         # ✅ El ForwardController ya manejó esto correctamente
         
         # Solo logging para debug (sin modificar UI)
-        print(f"   → Cliente {nit} seleccionado (valores ya configurados por ForwardController)")
+        _log.debug("   → Cliente %s seleccionado (valores ya configurados por ForwardController)", nit)
         
         # Nota: Otros updates (operaciones, charts) se manejan desde ForwardController
         # para mantener la separación de responsabilidades
     
     def _on_simulations_changed(self):
         """Handler para señal forward_simulations_changed."""
-        print("[MainWindow] _on_simulations_changed")
+        _log.debug("[MainWindow] _on_simulations_changed")
         
         # 🔒 NO actualizar exposición aquí.
         # Agregar/eliminar simulaciones no debe modificar los labels de exposición.
@@ -303,8 +311,10 @@ class MainWindow(QMainWindow):
             total_con_simulacion: Exposición total con simulaciones
             disponibilidad: Límite disponible
         """
-        print(f"[MainWindow] _on_exposure_updated: outstanding={outstanding}, "
-              f"total={total_con_simulacion}, disponibilidad={disponibilidad}")
+        _log.debug(
+            "[MainWindow] _on_exposure_updated: outstanding=%s, total=%s, disponibilidad=%s",
+            outstanding, total_con_simulacion, disponibilidad
+        )
         
         # Actualizar exposición en la vista
         self._forward_view.show_exposure(
@@ -4,14 +4,371 @@ Interfaz de usuario para gestionar la configuración del sistema.
 """
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QGroupBox, QFormLayout,
-    QLineEdit, QDoubleSpinBox, QFileDialog, QTableWidget, QTableWidgetItem,
+    QLineEdit, QDoubleSpinBox, QFileDialog, QTableView,
     QHeaderView, QAbstractItemView, QMessageBox, QAbstractSpinBox
 )
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import (
+    Signal, Qt, QTimer, QSignalBlocker, QDir, QFileInfo,
+    QObject, QRunnable, QThreadPool
+)
 from PySide6.QtGui import QFont, QDoubleValidator
 from typing import Dict, Any
+from contextlib import contextmanager
+import codecs
+import importlib.util
+import logging
+import os
+import re
+
+import pandas as pd
+
+from src.models.qt import CounterpartiesTableModel
+
+_log = logging.getLogger(__name__)
+
+# Columnas requeridas del CSV de contrapartes y sus alias (en minúsculas)
+_COLUMNAS_REQUERIDAS = ("NIT", "Contraparte", "Grupo Conectado de Contrapartes")
+_HEADER_ALIAS = {c.lower(): c for c in _COLUMNAS_REQUERIDAS}
+_COLUMNAS_CANONICAS = frozenset(_COLUMNAS_REQUERIDAS)
+
+# Motores de pd.read_csv en orden de preferencia: pyarrow (multihilo, libera
+# el GIL) si está instalado; el tokenizador C de pandas siempre como respaldo
+_CSV_ENGINES = ("pyarrow", "c") if importlib.util.find_spec("pyarrow") else ("c",)
+
+# Motores para la lectura por bloques (pyarrow no admite chunksize)
+_CSV_ENGINES_BLOQUES = ("c",)
+
+# Codificación de respaldo: cualquier secuencia de bytes es latin1 válido
+_CSV_ENCODING_RESPALDO = "latin1"
+
+# Tamaño a partir del cual el CSV se lee por bloques, y filas por bloque
+_CSV_CHUNK_MIN_BYTES = 32 * 1024 * 1024
+_CSV_CHUNK_ROWS = 65536
+
+# Espacios en blanco consecutivos (para normalizar encabezados del CSV)
+_WS_RE = re.compile(r"\s+")
+
+# Guiones y espacios dentro de un NIT
+_NIT_SEP_RE = re.compile(r"[-\s]+")
+
+# Campos de Parámetros Generales: (atributo, etiqueta, placeholder, máximo, decimales)
+_PARAMETROS_GENERALES_SPEC = (
+    ("trm_cop_usd", "TRM Vigente del día (COP/USD):", "Ingrese TRM COP/USD", 999999.0, 6),
+    ("trm_cop_eur", "TRM Vigente del día (COP/EUR):", "Ingrese TRM COP/EUR", 999999.0, 6),
+    ("lePatrimonioTecCOP", "Patrimonio técnico vigente (COP):", "Ingrese valor en COP (no en MM)", 1e15, 2),
+)
+
+# Hoja de estilos de la vista de configuración (se construye una sola vez al importar)
+_SETTINGS_QSS = """
+    /* QGroupBox - Estilo corporativo */
+    QGroupBox {
+        font-weight: 600;
+        margin-top: 12px;
+        border: 1px solid #E0E0E0;
+        border-radius: 8px;
+        padding: 8px 12px 12px 12px;
+    }
+
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 4px;
+    }
+
+    /* Labels */
+    QLabel {
+        color: #333333;
+    }
+
+    /* Inputs */
+    QLineEdit, QDoubleSpinBox {
+        padding: 4px 6px;
+        border: 1px solid #D6D6D6;
+        border-radius: 6px;
+    }
+
+    QLineEdit:focus, QDoubleSpinBox:focus {
+        border: 1px solid #0078D7;
+    }
+
+    /* Tabla */
+    #tblLineasCredito {
+        border: 1px solid #E0E0E0;
+        border-radius: 6px;
+        gridline-color: #F0F0F0;
+    }
+
+    #tblLineasCredito::item:selected {
+        background-color: #E3F2FD;
+        color: #000000;
+    }
+
+    /* Botón Cargar archivo */
+    QPushButton {
+        background-color: #0078D7;
+        color: white;
+        padding: 6px 14px;
+        border: none;
+        border-radius: 6px;
+        font-weight: 500;
+    }
+
+    QPushButton:hover {
+        background-color: #005a9e;
+    }
+
+    QPushButton:pressed {
+        background-color: #004578;
+    }
+"""
+
+
+class _ColumnasFaltantesError(ValueError):
+    """El CSV de contrapartes no trae todas las columnas requeridas."""
+    
+    def __init__(self, faltantes, detectadas):
+        super().__init__(f"Columnas faltantes: {', '.join(faltantes)}")
+        self.faltantes = faltantes
+        self.detectadas = detectadas
+
+
+def _normalizar_columna(c: str) -> str:
+    """Normaliza un nombre de columna eliminando caracteres especiales."""
+    # Camino rápido: encabezado ya limpio (ASCII imprimible, sin espacios sobrantes)
+    if c in _COLUMNAS_CANONICAS or (
+        c.isascii() and c.isprintable() and "  " not in c and c == c.strip()
+    ):
+        return c
+    c = c.replace("\ufeff", "")        # Eliminar BOM (Byte Order Mark)
+    c = c.replace("\xa0", " ")         # Eliminar NBSP (Non-Breaking Space)
+    return _WS_RE.sub(" ", c).strip()  # Colapsar múltiples espacios en uno
+
+
+def _detectar_codificacion(path: str, n_bytes: int = 65536) -> str:
+    """
+    Detecta la codificación del CSV leyendo solo su cabecera binaria.
+    
+    Args:
+        path: Ruta del archivo
+        n_bytes: Cantidad de bytes a inspeccionar
+        
+    Returns:
+        "utf-8-sig" si hay BOM, "utf-8" si la cabecera es UTF-8 válida, "latin1" en otro caso
+    """
+    with open(path, "rb") as f:
+        head = f.read(n_bytes)
+    
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    try:
+        # Decodificador incremental: tolera un carácter multibyte cortado al final
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "latin1"
+
+
+def _nombre_canonico(c: str) -> str:
+    """Normaliza un encabezado y lo traduce a su nombre canónico si es un alias."""
+    c = _normalizar_columna(c)
+    return c if c in _COLUMNAS_CANONICAS else _HEADER_ALIAS.get(c.lower(), c)
+
+
+def _columnas_a_leer(path: str, enc: str):
+    """
+    Lee solo la cabecera del CSV, valida las columnas requeridas y devuelve
+    los encabezados originales que les corresponden, para pasarlos como usecols.
+    
+    Args:
+        path: Ruta del archivo CSV
+        enc: Codificación a usar
+        
+    Returns:
+        Lista de encabezados a leer
+        
+    Raises:
+        _ColumnasFaltantesError: Si faltan columnas requeridas (sin leer el resto del archivo)
+    """
+    cabecera = pd.read_csv(path, sep=";", engine="c", encoding=enc, nrows=0).columns
+    nombres = [_nombre_canonico(c) for c in cabecera]
+    
+    faltantes = [col for col in _COLUMNAS_REQUERIDAS if col not in nombres]
+    if faltantes:
+        raise _ColumnasFaltantesError(faltantes, nombres)
+    
+    return [c for c, nombre in zip(cabecera, nombres) if nombre in _COLUMNAS_CANONICAS]
+
+
+def _leer_por_bloques(path: str, enc: str, usecols):
+    """
+    Lee un CSV grande en bloques de _CSV_CHUNK_ROWS filas, solo con las
+    columnas requeridas, acotando la memoria pico.
+    
+    Args:
+        path: Ruta del archivo CSV
+        enc: Codificación a usar
+        usecols: Encabezados a leer (ver _columnas_a_leer)
+        
+    Returns:
+        DataFrame con las columnas requeridas
+    """
+    reader = pd.read_csv(
+        path,
+        sep=";",
+        engine="c",
+        encoding=enc,
+        usecols=usecols,
+        dtype=str,
+        keep_default_na=False,
+        na_filter=False,
+        memory_map=True,  # Leer desde el mapeo del archivo, sin copia a un búfer intermedio
+        chunksize=_CSV_CHUNK_ROWS
+    )
+    
+    with reader:
+        bloques = list(reader)
+    
+    if not bloques:
+        return pd.DataFrame(columns=usecols)
+    return pd.concat(bloques, ignore_index=True)
+
+
+def _leer_csv_robusto(path: str):
+    """
+    Lee un CSV intentando múltiples codificaciones.
+    Soporta UTF-8, UTF-8 con BOM, y Latin-1.
+    
+    Args:
+        path: Ruta del archivo CSV
+        
+    Returns:
+        DataFrame con las columnas requeridas y nombres canónicos
+        
+    Raises:
+        _ColumnasFaltantesError: Si faltan columnas requeridas
+        ValueError: Si el archivo no se puede leer con ninguna codificación
+    """
+    df = None
+    # Codificación detectada sobre los primeros bytes; latin1 queda como
+    # respaldo por si aparece un byte no UTF-8 más adelante en el archivo
+    detectada = _detectar_codificacion(path)
+    candidatas = (
+        (detectada,) if detectada == _CSV_ENCODING_RESPALDO
+        else (detectada, _CSV_ENCODING_RESPALDO)
+    )
+    
+    # Archivos grandes: lectura por bloques
+    por_bloques = os.path.getsize(path) >= _CSV_CHUNK_MIN_BYTES
+    engines = _CSV_ENGINES_BLOQUES if por_bloques else _CSV_ENGINES
+    
+    for enc in candidatas:
+        # Cabecera una vez por codificación: valida las columnas requeridas
+        # y limita la lectura a ellas (solo se tokenizan esas columnas)
+        try:
+            usecols = _columnas_a_leer(path, enc)
+        except _ColumnasFaltantesError:
+            raise
+        except Exception as e:
+            _log.debug("      ✗ Falló la cabecera con %s: %s", enc, e)
+            continue
+        
+        for engine in engines:
+            try:
+                _log.debug("      Intentando con codificación: %s (motor %s)", enc, engine)
+                if por_bloques:
+                    df = _leer_por_bloques(path, enc, usecols)
+                else:
+                    df = pd.read_csv(
+                        path,
+                        sep=";",
+                        engine=engine,
+                        encoding=enc,
+                        usecols=usecols,
+                        dtype=str,
+                        keep_default_na=False,  # Evita convertir strings vacíos a NaN
+                        na_filter=False         # Sin búsqueda de nulos: todo se lee como texto
+                    )
+                _log.debug("      [OK] Lectura exitosa con %s (motor %s)", enc, engine)
+                break
+            except Exception as e:
+                _log.debug("      ✗ Falló con %s (motor %s): %s", enc, engine, e)
+                df = None
+        if df is not None:
+            break
+    
+    if df is None:
+        raise ValueError("No se pudo leer el CSV con ninguna codificación estándar (utf-8-sig o latin1).")
+    
+    # 🔹 Normalizar nombres de columnas y mapearlos según alias
+    # (insensible a mayúsculas/minúsculas) en una sola pasada
+    df.columns = [_nombre_canonico(c) for c in df.columns]
+    _log.debug("      [OK] Columnas normalizadas: %s", list(df.columns))
+    
+    return df
+
+
+def _leer_contrapartes_csv(path: str):
+    """
+    Lee, valida y limpia el CSV de contrapartes (sin tocar widgets, apto para
+    ejecutarse fuera del hilo de la GUI).
+    
+    Args:
+        path: Ruta del archivo CSV
+        
+    Returns:
+        DataFrame con NIT limpio y sin filas vacías
+        
+    Raises:
+        _ColumnasFaltantesError: Si faltan columnas requeridas
+        ValueError: Si el archivo no se puede leer con ninguna codificación
+    """
+    # Leer archivo con robustez
+    df = _leer_csv_robusto(path)
+    
+    # Columnas requeridas ya validadas sobre la cabecera (_columnas_a_leer)
+    _log.debug("   [OK] Columnas validadas correctamente")
+    _log.debug("   -> Filas leídas: %d", len(df))
+    
+    # 🔹 Limpiar y normalizar la columna NIT (quitar guiones y espacios)
+    # Una sola pasada vectorizada (la lectura con dtype=str ya garantiza texto)
+    df["NIT"] = df["NIT"].str.replace(_NIT_SEP_RE, "", regex=True)
+    _log.debug("   [OK] NITs normalizados (guiones y espacios eliminados)")
+    
+    # 🔹 Limpiar filas sin NIT o Contraparte
+    filas_antes = len(df)
+    df["Contraparte"] = df["Contraparte"].str.strip()
+    df = df[(df["NIT"] != "") & (df["Contraparte"] != "")]
+    filas_despues = len(df)
+    
+    if filas_antes > filas_despues:
+        _log.debug("   [!]  %d filas eliminadas por NIT o Contraparte vacío", filas_antes - filas_despues)
+    
+    return df
+
+
+class _CsvLoaderSignals(QObject):
+    """Señales del cargador de CSV (QRunnable no es QObject)."""
+    finished = Signal(object)  # DataFrame limpio
+    failed = Signal(object)    # Excepción producida
+
+
+class _CsvLoader(QRunnable):
+    """Tarea de QThreadPool que lee y limpia el CSV de contrapartes."""
+    
+    def __init__(self, path: str):
+        super().__init__()
+        self._path = path
+        self.signals = _CsvLoaderSignals()
+    
+    def run(self) -> None:
+        try:
+            df = _leer_contrapartes_csv(self._path)
+        except Exception as e:
+            self.signals.failed.emit(e)
+            return
+        self.signals.finished.emit(df)
 
 
 class SettingsView(QWidget):
@@ -26,6 +383,16 @@ class SettingsView(QWidget):
     
     # Señales personalizadas
     load_lineas_credito_requested = Signal(str)  # file_path
+    parametros_generales_changed = Signal()  # TRMs/Patrimonio editados (con debounce)
+    
+    # Milisegundos sin teclear antes de emitir parametros_generales_changed
+    _PARAM_DEBOUNCE_MS = 150
+    
+    # A partir de este número de filas se desactivan colores alternos y rejilla
+    _LARGE_TABLE_ROWS = 2000
+    
+    # Fuente del título compartida entre instancias (se crea en el primer _setup_ui)
+    _TITLE_FONT = None
     
     def __init__(self, parent: QWidget = None, settings_model=None):
         """
@@ -43,10 +410,28 @@ class SettingsView(QWidget):
         # Almacenar DataFrame de contrapartes
         self.df_lineas_credito = None
         
+        # Cargador de CSV en curso (referencia viva mientras corre en el pool)
+        self._csv_loader = None
+        
+        # Última lectura exitosa: ((ruta, mtime_ns, tamaño), DataFrame limpio)
+        self._csv_cache = None
+        self._csv_clave = None
+        
+        # Diálogo de selección de archivo (se crea en el primer uso y se reutiliza)
+        self._file_dialog = None
+        
+        # Validadores numéricos compartidos, por (máximo, decimales)
+        self._validadores = {}
+        
+        # Bloque de contrapartes diferido hasta el primer showEvent
+        self._main_layout = None
+        self._lineas_placeholder = None
+        self._lineas_built = False
+        
         self._setup_ui()
-        self._connect_signals()
+        self._setup_param_debounce()
         
-        print("[SettingsView] Vista de configuracion inicializada")
+        _log.debug("[SettingsView] Vista de configuracion inicializada")
     
     def _setup_ui(self) -> None:
         """
@@ -54,15 +439,18 @@ class SettingsView(QWidget):
         """
         # Layout principal
         main_layout = QVBoxLayout(self)
+        self._main_layout = main_layout
         main_layout.setContentsMargins(12, 12, 12, 12)
         main_layout.setSpacing(12)
         
         # Título del módulo
         title_label = QLabel("⚙️ Configuraciones del Sistema")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        if SettingsView._TITLE_FONT is None:
+            title_font = QFont()
+            title_font.setPointSize(14)
+            title_font.setBold(True)
+            SettingsView._TITLE_FONT = title_font
+        title_label.setFont(SettingsView._TITLE_FONT)
         main_layout.addWidget(title_label)
         
         main_layout.addSpacing(8)
@@ -76,8 +464,9 @@ class SettingsView(QWidget):
         main_layout.addWidget(group_normativos)
         
         # === 3. INFORMACIÓN DE CONTRAPARTES ===
-        group_lineas = self._create_lineas_credito()
-        main_layout.addWidget(group_lineas)
+        # La tabla se construye al mostrarse la vista (ver showEvent)
+        self._lineas_placeholder = QWidget()
+        main_layout.addWidget(self._lineas_placeholder)
         
         # Stretch al final
         main_layout.addStretch()
@@ -96,32 +485,14 @@ class SettingsView(QWidget):
         layout = QFormLayout(group)
         layout.setSpacing(8)
         
-        # TRM Vigente del día COP/USD
-        self.trm_cop_usd = QLineEdit()
-        self.trm_cop_usd.setPlaceholderText("Ingrese TRM COP/USD")
-        validator_cop = QDoubleValidator(0.0, 999999.0, 6)
-        validator_cop.setNotation(QDoubleValidator.StandardNotation)
-        self.trm_cop_usd.setValidator(validator_cop)
-        self.trm_cop_usd.setMinimumWidth(200)
-        layout.addRow("TRM Vigente del día (COP/USD):", self.trm_cop_usd)
-        
-        # TRM Vigente del día COP/EUR
-        self.trm_cop_eur = QLineEdit()
-        self.trm_cop_eur.setPlaceholderText("Ingrese TRM COP/EUR")
-        validator_eur = QDoubleValidator(0.0, 999999.0, 6)
-        validator_eur.setNotation(QDoubleValidator.StandardNotation)
-        self.trm_cop_eur.setValidator(validator_eur)
-        self.trm_cop_eur.setMinimumWidth(200)
-        layout.addRow("TRM Vigente del día (COP/EUR):", self.trm_cop_eur)
-        
-        # Patrimonio técnico vigente (COP)
-        self.lePatrimonioTecCOP = QLineEdit()
-        self.lePatrimonioTecCOP.setPlaceholderText("Ingrese valor en COP (no en MM)")
-        validator_patrimonio = QDoubleValidator(0.0, 1e15, 2, self)
-        validator_patrimonio.setNotation(QDoubleValidator.StandardNotation)
-        self.lePatrimonioTecCOP.setValidator(validator_patrimonio)
+        # Campos numéricos construidos desde la especificación declarativa
+        for attr, etiqueta, placeholder, maximo, decimales in _PARAMETROS_GENERALES_SPEC:
+            campo = self._make_numeric_line_edit(placeholder, maximo, decimales)
+            setattr(self, attr, campo)
+            layout.addRow(etiqueta, campo)
+        
+        # Patrimonio técnico vigente (COP): alineación y "caja" propias
         self.lePatrimonioTecCOP.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        self.lePatrimonioTecCOP.setMinimumWidth(200)
         self.lePatrimonioTecCOP.setStyleSheet("""
             QLineEdit {
                 background: white;
@@ -133,10 +504,51 @@ class SettingsView(QWidget):
                 border: 1px solid #6AA0FF;
             }
         """)
-        layout.addRow("Patrimonio técnico vigente (COP):", self.lePatrimonioTecCOP)
         
         return group
     
+    def _setup_param_debounce(self) -> None:
+        """
+        Agrupa las ediciones de TRMs y Patrimonio: cada tecla reinicia un
+        temporizador y solo al vencer se emite parametros_generales_changed.
+        """
+        self._param_timer = QTimer(self)
+        self._param_timer.setSingleShot(True)
+        self._param_timer.setInterval(self._PARAM_DEBOUNCE_MS)
+        self._param_timer.timeout.connect(self.parametros_generales_changed)
+        
+        for attr, *_ in _PARAMETROS_GENERALES_SPEC:
+            getattr(self, attr).textChanged.connect(self._on_parametro_editado)
+    
+    def _on_parametro_editado(self, _texto: str) -> None:
+        """Reinicia el temporizador de debounce de Parámetros Generales."""
+        self._param_timer.start()
+    
+    def _make_numeric_line_edit(self, placeholder: str, maximo: float, decimales: int) -> QLineEdit:
+        """
+        Crea un QLineEdit numérico con validador de rango [0, maximo].
+        Los campos con el mismo rango y decimales comparten validador.
+        
+        Args:
+            placeholder: Texto de ayuda del campo
+            maximo: Valor máximo aceptado
+            decimales: Número de decimales permitidos
+            
+        Returns:
+            QLineEdit configurado
+        """
+        campo = QLineEdit()
+        campo.setPlaceholderText(placeholder)
+        validator = self._validadores.get((maximo, decimales))
+        if validator is None:
+            # Un solo validador por rango/precisión, compartido entre campos (p. ej. ambas TRM)
+            validator = QDoubleValidator(0.0, maximo, decimales, self)
+            validator.setNotation(QDoubleValidator.StandardNotation)
+            self._validadores[(maximo, decimales)] = validator
+        campo.setValidator(validator)
+        campo.setMinimumWidth(200)
+        return campo
+    
     def _create_parametros_normativos(self) -> QGroupBox:
         """
         Crea el bloque de Parámetros Normativos.
@@ -211,21 +623,28 @@ class SettingsView(QWidget):
         header_layout.addStretch()
         
         self.btnCargarLineas = QPushButton("📁 Cargar archivo...")
-        self.btnCargarLineas.clicked.connect(self.cargar_csv_lineas_credito)
+        self.btnCargarLineas.clicked.connect(self.cargar_csv_lineas_credito, Qt.UniqueConnection)
         header_layout.addWidget(self.btnCargarLineas)
         
         layout.addLayout(header_layout)
         
-        # Tabla de contrapartes (QTableWidget para manejo directo)
-        self.tblLineasCredito = QTableWidget()
+        # Tabla de contrapartes (QTableView sobre un modelo por columnas:
+        # solo se formatean las celdas visibles, sin un ítem por celda)
+        self.tblLineasCredito = QTableView()
         self.tblLineasCredito.setObjectName("tblLineasCredito")
+        self._lineas_model = CounterpartiesTableModel(self)
+        self.tblLineasCredito.setModel(self._lineas_model)
         
         # Configurar tabla
         header = self.tblLineasCredito.horizontalHeader()
         header.setStretchLastSection(True)
-        header.setSectionResizeMode(QHeaderView.Stretch)
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setResizeContentsPrecision(50)  # Medir solo una muestra de filas
         
         self.tblLineasCredito.verticalHeader().setVisible(False)
+        # Alto de fila fijo: evita medir cada fila al insertar
+        self.tblLineasCredito.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.tblLineasCredito.verticalHeader().setDefaultSectionSize(24)
         self.tblLineasCredito.setAlternatingRowColors(True)
         self.tblLineasCredito.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.tblLineasCredito.setSelectionMode(QAbstractItemView.SingleSelection)
@@ -235,17 +654,53 @@ class SettingsView(QWidget):
         
         return group
     
-    def _connect_signals(self) -> None:
+    def showEvent(self, event) -> None:
         """
-        Conecta las señales de los widgets.
+        Programa la construcción diferida del bloque de contrapartes
+        la primera vez que la vista se muestra.
         """
-        # Las conexiones se manejan directamente en los widgets
-        pass
+        super().showEvent(event)
+        if not self._lineas_built:
+            QTimer.singleShot(0, self._build_lineas_deferred)
+    
+    def _build_lineas_deferred(self) -> None:
+        """
+        Construye el bloque de Información de contrapartes y lo sustituye
+        por el placeholder en el layout principal. Idempotente.
+        """
+        if self._lineas_built:
+            return
+        self._lineas_built = True
+        
+        group_lineas = self._create_lineas_credito()
+        self._main_layout.replaceWidget(self._lineas_placeholder, group_lineas)
+        self._lineas_placeholder.deleteLater()
+        self._lineas_placeholder = None
+    
+    def _get_file_dialog(self) -> QFileDialog:
+        """
+        Devuelve el diálogo de selección de CSV, creándolo la primera vez.
+        
+        Returns:
+            QFileDialog persistente configurado para un único archivo existente
+        """
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(
+                self,
+                "Seleccionar archivo de contrapartes",
+                "",
+                "Archivos CSV (*.csv);;Todos los archivos (*)"
+            )
+            self._file_dialog.setFileMode(QFileDialog.ExistingFile)
+            self._file_dialog.setAcceptMode(QFileDialog.AcceptOpen)
+        return self._file_dialog
     
     def cargar_csv_lineas_credito(self):
         """
         Carga el archivo CSV de contrapartes y muestra los datos en la tabla.
         Versión robusta que soporta múltiples codificaciones y variaciones en encabezados.
+        La lectura y limpieza corren en QThreadPool (ver _leer_contrapartes_csv);
+        el resultado se aplica en _on_csv_lineas_cargado.
         
         Reglas:
         - CSV delimitado por ';'
@@ -255,146 +710,111 @@ class SettingsView(QWidget):
         - Normaliza nombres de columnas (elimina BOM, NBSP, espacios extras)
         - Reconoce variaciones en nombres de columnas (case-insensitive)
         """
-        print("[SettingsView] Abriendo dialogo para cargar información de contrapartes...")
+        _log.debug("[SettingsView] Abriendo dialogo para cargar información de contrapartes...")
         
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Seleccionar archivo de contrapartes",
-            "",
-            "Archivos CSV (*.csv);;Todos los archivos (*)"
-        )
-        
-        if not file_path:
-            print("[SettingsView] Carga cancelada por el usuario")
+        dialog = self._get_file_dialog()
+        if not dialog.exec() or not dialog.selectedFiles():
+            _log.debug("[SettingsView] Carga cancelada por el usuario")
             return
         
+        file_path = dialog.selectedFiles()[0]
+        # Recordar la carpeta para la próxima apertura
+        dialog.setDirectory(QFileInfo(file_path).absolutePath())
+        
+        _log.debug("[SettingsView] Cargando archivo: %s", QDir.toNativeSeparators(file_path))
+        
+        # El botón y la tabla pueden no existir aún si la vista no se ha mostrado
+        self._build_lineas_deferred()
+        
+        # Mismo archivo sin cambios desde la última carga: reutilizar el resultado
         try:
-            import pandas as pd
-            import re
-            
-            print(f"[SettingsView] Cargando archivo: {file_path}")
-            
-            # 🔹 Función de lectura robusta
-            def leer_csv_robusto(path):
-                """
-                Lee un CSV intentando múltiples codificaciones.
-                Soporta UTF-8, UTF-8 con BOM, y Latin-1.
-                """
-                df = None
-                # Intentar con utf-8-sig (maneja BOM automáticamente) y latin1
-                for enc in ("utf-8-sig", "latin1"):
-                    try:
-                        print(f"      Intentando con codificación: {enc}")
-                        df = pd.read_csv(
-                            path,
-                            sep=";",
-                            engine="python",
-                            encoding=enc,
-                            dtype=str,
-                            keep_default_na=False  # Evita convertir strings vacíos a NaN
-                        )
-                        print(f"      [OK] Lectura exitosa con {enc}")
-                        break
-                    except Exception as e:
-                        print(f"      ✗ Falló con {enc}: {e}")
-                        df = None
-                
-                if df is None:
-                    raise ValueError("No se pudo leer el CSV con ninguna codificación estándar (utf-8-sig o latin1).")
-                
-                # 🔹 Normalizar nombres de columnas
-                def normalizar(c):
-                    """Normaliza un nombre de columna eliminando caracteres especiales."""
-                    c = c.replace("\ufeff", "")        # Eliminar BOM (Byte Order Mark)
-                    c = c.replace("\xa0", " ")         # Eliminar NBSP (Non-Breaking Space)
-                    c = re.sub(r"\s+", " ", c).strip() # Colapsar múltiples espacios en uno
-                    return c
-                
-                df.columns = [normalizar(c) for c in df.columns]
-                print(f"      [OK] Columnas normalizadas: {list(df.columns)}")
-                
-                return df
-            
-            # Leer archivo con robustez
-            df = leer_csv_robusto(file_path)
-            
-            # 🔹 Normalizar headers usando alias (case-insensitive)
-            alias = {
-                "nit": "NIT",
-                "contraparte": "Contraparte",
-                "grupo conectado de contrapartes": "Grupo Conectado de Contrapartes",
-            }
-            
-            # Mapear columnas según alias (insensible a mayúsculas/minúsculas)
-            df.rename(columns=lambda c: alias.get(c.lower(), c), inplace=True)
-            print(f"   [OK] Columnas después de mapeo: {list(df.columns)}")
-            
-            # Columnas esperadas (mínimas)
-            columnas_esperadas = ["NIT", "Contraparte", "Grupo Conectado de Contrapartes"]
-            
-            # Validar columnas requeridas
-            faltantes = [col for col in columnas_esperadas if col not in df.columns]
-            if faltantes:
-                print(f"   [ERROR] Error: Columnas faltantes en el archivo")
-                print(f"      Faltantes: {faltantes}")
-                print(f"      Detectadas: {list(df.columns)}")
-                QMessageBox.warning(
-                    self,
-                    "Error de formato",
-                    f"El archivo no contiene las columnas requeridas:\n{', '.join(faltantes)}\n\n"
-                    f"Columnas detectadas: {', '.join(df.columns)}"
-                )
+            st = os.stat(file_path)
+            self._csv_clave = (file_path, st.st_mtime_ns, st.st_size)
+        except OSError:
+            self._csv_clave = None  # El cargador informará el error
+        if self._csv_cache is not None and self._csv_cache[0] == self._csv_clave:
+            _log.debug("   [OK] Archivo sin cambios desde la última carga; se reutiliza")
+            self._on_csv_lineas_cargado(self._csv_cache[1])
+            return
+        
+        # Lectura y limpieza en QThreadPool; el resultado vuelve al hilo de la GUI
+        loader = _CsvLoader(file_path)
+        loader.signals.finished.connect(self._on_csv_lineas_cargado)
+        loader.signals.failed.connect(self._on_csv_lineas_fallido)
+        self._csv_loader = loader  # Mantener vivas las señales hasta la entrega
+        self.btnCargarLineas.setEnabled(False)
+        QApplication.setOverrideCursor(Qt.BusyCursor)
+        QThreadPool.globalInstance().start(loader)
+    
+    def _finalizar_carga_csv(self) -> None:
+        """Libera el cargador, restaura el cursor y reactiva el botón de carga."""
+        if self._csv_loader is not None:
+            self._csv_loader = None
+            QApplication.restoreOverrideCursor()
+        self.btnCargarLineas.setEnabled(True)
+    
+    def _on_csv_lineas_cargado(self, df) -> None:
+        """
+        Recibe el DataFrame limpio del cargador y lo guarda en el modelo.
+        
+        Args:
+            df: DataFrame de contrapartes ya validado y limpio
+        """
+        self._finalizar_carga_csv()
+        
+        # Guardar el DataFrame en el modelo (única fuente de verdad)
+        if self._settings_model:
+            # Al guardar en el modelo, se emite lineasCreditoChanged
+            # que dispara el recálculo automático en el controlador
+            try:
+                self._settings_model.set_lineas_credito(df)
+            except Exception as e:
+                self._on_csv_lineas_fallido(e)
                 return
-            
-            print(f"   [OK] Columnas validadas correctamente")
-            print(f"   -> Filas leídas: {len(df)}")
-            
-            # 🔹 Limpiar y normalizar la columna NIT (quitar guiones y espacios)
-            df["NIT"] = (
-                df["NIT"].astype(str)
-                .str.replace("-", "", regex=False)
-                .str.replace(" ", "", regex=False)
-                .str.strip()
+            _log.debug("   [OK] DataFrame guardado en SettingsModel (%d filas)", len(df))
+            if self._csv_clave is not None:
+                self._csv_cache = (self._csv_clave, df)
+        else:
+            _log.warning("[SettingsView] Modelo no disponible, no se puede guardar")
+        
+        # Mensaje de éxito
+        QMessageBox.information(
+            self,
+            "Carga exitosa",
+            f"El archivo de información de contrapartes fue cargado correctamente.\n\n"
+            f"Contrapartes cargadas: {len(df)}"
+        )
+        
+        _log.debug("   [OK] Carga completada exitosamente")
+    
+    def _on_csv_lineas_fallido(self, error) -> None:
+        """
+        Informa al usuario del error producido al leer el CSV.
+        
+        Args:
+            error: Excepción producida en el cargador
+        """
+        self._finalizar_carga_csv()
+        
+        if isinstance(error, _ColumnasFaltantesError):
+            _log.warning(
+                "[SettingsView] Columnas faltantes en el archivo: %s (detectadas: %s)",
+                error.faltantes, error.detectadas
             )
-            print(f"   [OK] NITs normalizados (guiones y espacios eliminados)")
-            
-            # 🔹 Limpiar filas sin NIT o Contraparte
-            filas_antes = len(df)
-            df["Contraparte"] = df["Contraparte"].astype(str).str.strip()
-            df = df[(df["NIT"].str.strip() != "") & (df["Contraparte"] != "")]
-            filas_despues = len(df)
-            
-            if filas_antes > filas_despues:
-                print(f"   [!]  {filas_antes - filas_despues} filas eliminadas por NIT o Contraparte vacío")
-            
-            # Guardar el DataFrame en el modelo (única fuente de verdad)
-            if self._settings_model:
-                # Al guardar en el modelo, se emite lineasCreditoChanged
-                # que dispara el recálculo automático en el controlador
-                self._settings_model.set_lineas_credito(df)
-                print(f"   [OK] DataFrame guardado en SettingsModel ({len(df)} filas)")
-            else:
-                print(f"   [!]  Modelo no disponible, no se puede guardar")
-            
-            # Mensaje de éxito
-            QMessageBox.information(
+            QMessageBox.warning(
                 self,
-                "Carga exitosa",
-                f"El archivo de información de contrapartes fue cargado correctamente.\n\n"
-                f"Contrapartes cargadas: {len(df)}"
+                "Error de formato",
+                f"El archivo no contiene las columnas requeridas:\n{', '.join(error.faltantes)}\n\n"
+                f"Columnas detectadas: {', '.join(error.detectadas)}"
             )
-            
-            print(f"   [OK] Carga completada exitosamente")
+            return
         
-        except Exception as e:
-            print(f"   [ERROR] Error al cargar archivo: {e}")
-            import traceback
-            traceback.print_exc()
-            QMessageBox.critical(
-                self,
-                "Error al cargar",
-                f"Ocurrió un error al leer el archivo:\n{str(e)}"
-            )
+        _log.error("[SettingsView] Error al cargar archivo: %s", error, exc_info=error)
+        QMessageBox.critical(
+            self,
+            "Error al cargar",
+            f"Ocurrió un error al leer el archivo:\n{str(error)}"
+        )
     
     def mostrar_lineas_credito(self, df):
         """
@@ -403,46 +823,38 @@ class SettingsView(QWidget):
         Args:
             df: DataFrame de pandas con las contrapartes
         """
-        import pandas as pd
-        
-        print(f"[SettingsView] Mostrando {len(df)} contrapartes en la tabla...")
-        
-        # Determinar columnas a mostrar (solo las requeridas)
-        columnas_orden = ["NIT", "Contraparte", "Grupo Conectado de Contrapartes"]
+        _log.debug("[SettingsView] Mostrando %d contrapartes en la tabla...", len(df))
         
-        # Filtrar solo las que existen en el DataFrame
-        columnas_a_mostrar = [col for col in columnas_orden if col in df.columns]
+        # Si la vista aún no se ha mostrado, construir la tabla ahora
+        self._build_lineas_deferred()
         
-        # Limpiar tabla
-        self.tblLineasCredito.setRowCount(0)
-        self.tblLineasCredito.setColumnCount(len(columnas_a_mostrar))
-        
-        # Configurar encabezados (mantener nombres exactos)
-        self.tblLineasCredito.setHorizontalHeaderLabels(columnas_a_mostrar)
-        
-        # Insertar filas
-        for i, row in df.iterrows():
-            self.tblLineasCredito.insertRow(i)
+        # Congelar repintado, señales y ordenamiento mientras se reconstruye la tabla
+        tv = self.tblLineasCredito
+        tv.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(tv)
+        was_sorting = tv.isSortingEnabled()
+        tv.setSortingEnabled(False)
+        try:
+            # En tablas grandes, colores alternos y rejilla duplican el área pintada
+            tabla_pequena = len(df) < self._LARGE_TABLE_ROWS
+            tv.setAlternatingRowColors(tabla_pequena)
+            tv.setShowGrid(tabla_pequena)
             
-            for j, col in enumerate(columnas_a_mostrar):
-                valor = row[col]
-                
-                # Formatear según tipo de dato
-                if col == "NIT":
-                    texto = str(valor)
-                elif col in ["Contraparte", "Grupo Conectado de Contrapartes"]:
-                    texto = str(valor) if pd.notna(valor) else ""
-                else:
-                    texto = str(valor) if pd.notna(valor) else ""
-                
-                self.tblLineasCredito.setItem(i, j, QTableWidgetItem(texto))
-        
-        # Ajustar columnas para distribución proporcional (todas del mismo tamaño)
-        header = self.tblLineasCredito.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.Stretch)  # Todas las columnas se distribuyen uniformemente
-        
-        num_cols = len(columnas_a_mostrar)
-        print(f"   [OK] Tabla actualizada con {len(df)} filas y {num_cols} columnas (columnas con tamaño proporcional)")
+            # Reemplazar los datos del modelo (un único reset)
+            self._lineas_model.set_dataframe(df)
+            
+            # Ajustar anchos una sola vez al contenido; luego quedan interactivos
+            # (Stretch recalculaba todas las columnas en cada resize/inserción)
+            tv.resizeColumnsToContents()
+        finally:
+            tv.setSortingEnabled(was_sorting)
+            blocker.unblock()
+            tv.setUpdatesEnabled(True)
+        
+        _log.debug(
+            "   [OK] Tabla actualizada con %d filas y %d columnas (anchos ajustados al contenido)",
+            self._lineas_model.rowCount(), self._lineas_model.columnCount()
+        )
     
     def load_parametros_generales(self, patrimonio_cop: float, trm: float) -> None:
         """
@@ -452,16 +864,56 @@ class SettingsView(QWidget):
             patrimonio_cop: Patrimonio técnico en COP (valor real, no millones)
             trm: TRM vigente del día
         """
-        self.inpPatrimonio.blockSignals(True)
-        self.inpTRM.blockSignals(True)
-        
-        self.inpPatrimonio.setValue(patrimonio_cop)
-        self.inpTRM.setValue(trm)
-        
-        self.inpPatrimonio.blockSignals(False)
-        self.inpTRM.blockSignals(False)
+        # Solo reescribir los campos cuyo valor cambió (evita re-formateo y repintado)
+        pares = [
+            (w, f"{valor:.{decimales}f}")
+            for w, valor, decimales in (
+                (self.lePatrimonioTecCOP, patrimonio_cop, 2),
+                (self.trm_cop_usd, trm, 6),
+            )
+            if not self._mismo_valor(w.text(), valor, decimales)
+        ]
+        
+        with self._bulk_update(*(w for w, _ in pares)):
+            for w, texto in pares:
+                w.setText(texto)
+        
+        # El formato con separador de miles solo se paga si DEBUG está activo
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "[SettingsView] Parametros generales cargados: Patrimonio=%s COP, TRM=%s",
+                f"{patrimonio_cop:,.2f}", trm
+            )
+    
+    @contextmanager
+    def _bulk_update(self, *widgets):
+        """
+        Bloquea las señales de los widgets dados mientras dura el bloque; se
+        restauran aunque ocurra una excepción. El repintado no se suspende:
+        Qt ya agrupa los setText en un solo pintado por pasada del bucle.
         
-        print(f"[SettingsView] Parametros generales cargados: Patrimonio={patrimonio_cop:,.2f} COP, TRM={trm}")
+        Args:
+            *widgets: Widgets cuyas señales se deben bloquear
+        """
+        blockers = [QSignalBlocker(w) for w in widgets]
+        try:
+            yield
+        finally:
+            for b in blockers:
+                b.unblock()
+    
+    @staticmethod
+    def _mismo_valor(texto: str, valor: float, decimales: int) -> bool:
+        """
+        Indica si el texto de un campo ya representa el valor dado.
+        Tolera separadores de miles y diferencias menores a media unidad
+        del último decimal mostrado.
+        """
+        try:
+            actual = float(texto.replace(",", ""))
+        except ValueError:
+            return False
+        return abs(actual - valor) <= 10 ** -decimales / 2
     
     def load_parametros_normativos(self) -> None:
         """
@@ -471,20 +923,29 @@ class SettingsView(QWidget):
         
         Este método se mantiene por compatibilidad pero no hace nada.
         """
-        print(f"[SettingsView] Parámetros normativos ya están fijos (LLL=25%, Colchón=10%)")
+        _log.debug("[SettingsView] Parámetros normativos ya están fijos (LLL=25%, Colchón=10%)")
     
     def get_parametros_generales(self) -> Dict[str, float]:
         """
         Obtiene los parámetros generales actuales.
         
         Returns:
-            Diccionario con patrimonio_cop (valor en COP, no millones) y TRM
+            Diccionario con patrimonio_cop (valor en COP, no millones) y TRM;
+            un campo vacío o no numérico se reporta como 0.0
         """
         return {
-            "patrimonio_cop": self.inpPatrimonio.value(),
-            "trm": self.inpTRM.value()
+            "patrimonio_cop": self._valor_campo(self.lePatrimonioTecCOP),
+            "trm": self._valor_campo(self.trm_cop_usd)
         }
     
+    @staticmethod
+    def _valor_campo(campo: QLineEdit) -> float:
+        """Convierte el texto de un campo numérico a float (sin separador de miles)."""
+        try:
+            return float(campo.text().replace(",", ""))
+        except ValueError:
+            return 0.0
+    
     def get_parametros_normativos(self) -> Dict[str, float]:
         """
         Obtiene los parámetros normativos actuales (valores fijos).
@@ -501,77 +962,16 @@ class SettingsView(QWidget):
         """
         [OBSOLETO] Este método ya no es necesario.
         
-        La tabla de contrapartes ahora usa QTableWidget y se actualiza
-        directamente desde el método cargar_csv_lineas_credito().
+        La tabla de contrapartes usa su propio CounterpartiesTableModel y se
+        actualiza desde mostrar_lineas_credito() al cargar el CSV.
         
         Args:
             model: Modelo QAbstractTableModel (ignorado)
         """
-        print("[SettingsView] set_lineas_credito_model está obsoleto - use cargar_csv_lineas_credito()")
+        _log.debug("[SettingsView] set_lineas_credito_model está obsoleto - use cargar_csv_lineas_credito()")
         pass
     
     def _apply_styles(self):
         """Aplica estilos CSS corporativos sobrios a la vista."""
-        self.setStyleSheet("""
-            /* QGroupBox - Estilo corporativo */
-            QGroupBox {
-                font-weight: 600;
-                margin-top: 12px;
-                border: 1px solid #E0E0E0;
-                border-radius: 8px;
-                padding: 8px 12px 12px 12px;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 4px;
-            }
-            
-            /* Labels */
-            QLabel {
-                color: #333333;
-            }
-            
-            /* Inputs */
-            QLineEdit, QDoubleSpinBox {
-                padding: 4px 6px;
-                border: 1px solid #D6D6D6;
-                border-radius: 6px;
-            }
-            
-            QLineEdit:focus, QDoubleSpinBox:focus {
-                border: 1px solid #0078D7;
-            }
-            
-            /* Tabla */
-            #tblLineasCredito {
-                border: 1px solid #E0E0E0;
-                border-radius: 6px;
-                gridline-color: #F0F0F0;
-            }
-            
-            #tblLineasCredito::item:selected {
-                background-color: #E3F2FD;
-                color: #000000;
-            }
-            
-            /* Botón Cargar archivo */
-            QPushButton {
-                background-color: #0078D7;
-                color: white;
-                padding: 6px 14px;
-                border: none;
-                border-radius: 6px;
-                font-weight: 500;
-            }
-            
-            QPushButton:hover {
-                background-color: #005a9e;
-            }
-            
-            QPushButton:pressed {
-                background-color: #004578;
-            }
-        """)
+        self.setStyleSheet(_SETTINGS_QSS)
 
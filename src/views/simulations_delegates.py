@@ -3,7 +3,7 @@ Delegates personalizados para la tabla de simulaciones.
 """
 
 from PySide6.QtWidgets import QStyledItemDelegate, QComboBox, QDateEdit
-from PySide6.QtCore import QDate
+from PySide6.QtCore import Qt, QDate
 
 
 class PuntaClienteDelegate(QStyledItemDelegate):
@@ -33,7 +33,7 @@ class PuntaClienteDelegate(QStyledItemDelegate):
             editor: QComboBox
             index: Índice de la celda
         """
-        value = index.model().data(index, role=2)  # Qt.EditRole = 2
+        value = index.model().data(index, role=Qt.EditRole)
         if value:
             editor.setCurrentText(str(value))
     
@@ -47,7 +47,7 @@ class PuntaClienteDelegate(QStyledItemDelegate):
             index: Índice de la celda
         """
         value = editor.currentText()
-        model.setData(index, value, role=2)  # Qt.EditRole = 2
+        model.setData(index, value, role=Qt.EditRole)
 
 
 class FechaDelegate(QStyledItemDelegate):
@@ -79,21 +79,16 @@ class FechaDelegate(QStyledItemDelegate):
             editor: QDateEdit
             index: Índice de la celda
         """
-        value = index.model().data(index, role=2)  # Qt.EditRole = 2
+        value = index.model().data(index, role=Qt.EditRole)
         if value:
-            # Intentar parsear la fecha
-            try:
-                if isinstance(value, str):
-                    # Formato: YYYY-MM-DD
-                    parts = value.split('-')
-                    if len(parts) == 3:
-                        year, month, day = int(parts[0]), int(parts[1]), int(parts[2])
-                        editor.setDate(QDate(year, month, day))
-                elif hasattr(value, 'year'):
-                    # Es un objeto date de Python
-                    editor.setDate(QDate(value.year, value.month, value.day))
-            except (ValueError, IndexError):
-                editor.setDate(QDate.currentDate())
+            if isinstance(value, str):
+                # Formato: YYYY-MM-DD (también acepta mes/día sin cero inicial);
+                # una fecha inválida devuelve un QDate inválido en lugar de lanzar
+                fecha = QDate.fromString(value, "yyyy-M-d")
+                editor.setDate(fecha if fecha.isValid() else QDate.currentDate())
+            elif hasattr(value, 'year'):
+                # Es un objeto date de Python
+                editor.setDate(QDate(value.year, value.month, value.day))
         else:
             editor.setDate(QDate.currentDate())
     
@@ -107,6 +102,6 @@ class FechaDelegate(QStyledItemDelegate):
             index: Índice de la celda
         """
         value = editor.date().toString("yyyy-MM-dd")
-        model.setData(index, value, role=2)  # Qt.EditRole = 2
+        model.setData(index, value, role=Qt.EditRole)
 
 
@@ -33,10 +33,10 @@ def test_csv_load_and_parse():
     print(f"   Filas: {len(df)}")
     
     # Normalizar NIT
-    df["NIT"] = df["NIT"].str.replace("-", "", regex=False).str.replace(" ", "", regex=False).str.replace(".", "", regex=False).str.strip()
+    df["NIT"] = df["NIT"].str.replace(r"[-\s.]", "", regex=True)
     print(f"\n[OK] NITs normalizados:")
-    for idx, row in df.iterrows():
-        print(f"   {row['NIT']:15} -> {row['Contraparte']}")
+    for nit, nombre in zip(df["NIT"].to_numpy(), df["Contraparte"].to_numpy()):
+        print(f"   {nit:15} -> {nombre}")
     
     assert "NIT" in df.columns, "Falta columna NIT"
     assert "Contraparte" in df.columns, "Falta columna Contraparte"
@@ -56,7 +56,7 @@ def test_settings_model_integration(df):
     
     # Filtrar solo las 3 columnas (como hace el modelo)
     required_cols = ["NIT", "Contraparte", "Grupo Conectado de Contrapartes"]
-    df_filtered = df[required_cols].copy()
+    df_filtered = df[required_cols]
     
     print(f"\n[DF] DataFrame filtrado:")
     print(f"   Columnas: {list(df_filtered.columns)}")
@@ -168,7 +168,7 @@ def test_csv_with_extra_columns():
     
     # Filtrar solo las 3 requeridas
     required_cols = ["NIT", "Contraparte", "Grupo Conectado de Contrapartes"]
-    df_filtered = df[required_cols].copy()
+    df_filtered = df[required_cols]
     
     print(f"\n[FILTER] Despues de filtrar:")
     print(f"   Columnas: {list(df_filtered.columns)}")
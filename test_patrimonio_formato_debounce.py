@@ -0,0 +1,60 @@
+"""
+Test para verificar que el formato de miles del Patrimonio técnico sobrevive al debounce.
+
+Este test verifica:
+1. Escribir el valor y salir del campo antes de que venza el debounce lo formatea (1,234,567.00)
+2. Al vencer el debounce, el modelo recibe el valor sin separadores
+3. El eco del modelo hacia la vista NO borra los separadores de miles
+"""
+
+import sys
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QEvent
+from PySide6.QtGui import QFocusEvent
+
+from src.models.settings_model import SettingsModel
+from src.views.settings_view import SettingsView
+from src.controllers.settings_controller import SettingsController
+
+
+def test_focus_out_antes_del_debounce():
+    """Test: FocusOut formatea y el push diferido al modelo no pisa el formato."""
+    print("\n" + "="*70)
+    print("TEST: FocusOut antes del debounce de Parámetros Generales")
+    print("="*70)
+    
+    app = QApplication.instance() or QApplication(sys.argv)
+    
+    model = SettingsModel()
+    view = SettingsView(settings_model=model)
+    controller = SettingsController(view=view, model=model)
+    campo = view.lePatrimonioTecCOP
+    
+    # Escribir el valor: el debounce queda pendiente
+    campo.setText("1234567")
+    assert view._param_timer.isActive(), "El debounce debe quedar pendiente tras la edición"
+    assert model.patrimonio_tec_cop() is None, "El modelo no debe actualizarse antes del debounce"
+    
+    # Salir del campo antes de que venza el debounce
+    QApplication.sendEvent(campo, QFocusEvent(QEvent.FocusOut))
+    print(f"\n   Texto tras FocusOut: {campo.text()}")
+    assert campo.text() == "1,234,567.00", f"Formato incorrecto tras FocusOut: {campo.text()}"
+    
+    # Vence el debounce: se empuja el valor al modelo y este hace eco a la vista
+    view._param_timer.stop()
+    view._param_timer.timeout.emit()
+    print(f"   Modelo: {model.patrimonio_tec_cop()}")
+    print(f"   Texto tras el debounce: {campo.text()}")
+    
+    assert model.patrimonio_tec_cop() == 1234567.0, f"Valor incorrecto en el modelo: {model.patrimonio_tec_cop()}"
+    assert campo.text() == "1,234,567.00", f"El eco del modelo borró el formato: {campo.text()}"
+    
+    print("\n[OK] TEST PASADO: el formato de miles se conserva tras el debounce")
+
+
+if __name__ == "__main__":
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    
+    test_focus_out_antes_del_debounce()
@@ -0,0 +1,111 @@
+"""
+Test para verificar el modelo de tabla de Información de contrapartes.
+
+Este test verifica:
+1. CounterpartiesTableModel expone solo las 3 columnas del catálogo
+2. Las filas se direccionan por posición aunque el índice del DataFrame tenga huecos
+3. SettingsView.mostrar_lineas_credito alimenta el QTableView a través del modelo
+4. Un catálogo con grupo en todas las filas (columna categórica) llega completo a la tabla
+"""
+
+import sys
+import pandas as pd
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import Qt
+
+from src.models.qt import CounterpartiesTableModel
+from src.models.settings_model import SettingsModel
+from src.views.settings_view import SettingsView
+
+
+def _df_con_huecos() -> pd.DataFrame:
+    """DataFrame filtrado como lo deja el loader (índice 0, 2 y columna extra)."""
+    df = pd.DataFrame({
+        "NIT": ["900123456", "", "900345678"],
+        "Contraparte": ["Empresa Alpha", "Sin NIT", "Corporación Gamma"],
+        "Grupo Conectado de Contrapartes": ["Grupo Financiero A", "", ""],
+        "NIT_norm": ["900123456", "", "900345678"],
+    })
+    return df[df["NIT"] != ""]
+
+
+def test_model_columnas_y_filas():
+    """Test: el modelo muestra 3 columnas y todas las filas por posición."""
+    print("\n" + "="*70)
+    print("TEST 1: CounterpartiesTableModel")
+    print("="*70)
+    
+    model = CounterpartiesTableModel()
+    model.set_dataframe(_df_con_huecos())
+    
+    headers = [model.headerData(c, Qt.Horizontal) for c in range(model.columnCount())]
+    print(f"\n   Columnas: {headers}")
+    print(f"   Filas: {model.rowCount()}")
+    
+    assert headers == ["NIT", "Contraparte", "Grupo Conectado de Contrapartes"], f"Columnas incorrectas: {headers}"
+    assert model.rowCount() == 2, f"Se esperaban 2 filas, se obtuvieron {model.rowCount()}"
+    assert model.data(model.index(1, 1)) == "Corporación Gamma"
+    assert model.data(model.index(1, 2)) == ""
+    assert model.data(model.index(0, 0), Qt.EditRole) is None
+    
+    model.set_dataframe(pd.DataFrame())
+    assert model.rowCount() == 0, "El modelo debe quedar vacío"
+    
+    print("\n[OK] TEST 1 PASADO: modelo por columnas con filas por posición")
+
+
+def test_settings_view_usa_modelo():
+    """Test: mostrar_lineas_credito llena la tabla aunque la vista no se haya mostrado."""
+    print("\n" + "="*70)
+    print("TEST 2: SettingsView.mostrar_lineas_credito()")
+    print("="*70)
+    
+    app = QApplication.instance() or QApplication(sys.argv)
+    
+    view = SettingsView()
+    view.mostrar_lineas_credito(_df_con_huecos())
+    
+    model = view.tblLineasCredito.model()
+    print(f"\n   Filas en la tabla: {model.rowCount()}")
+    
+    assert model.rowCount() == 2, f"Se esperaban 2 filas, se obtuvieron {model.rowCount()}"
+    assert model.data(model.index(1, 0)) == "900345678"
+    
+    print("\n[OK] TEST 2 PASADO: la vista usa el modelo de contrapartes")
+
+
+def test_catalogo_agrupado_desde_settings_model():
+    """Test: catálogo con grupo en todas las filas, de SettingsModel a SettingsView."""
+    print("\n" + "="*70)
+    print("TEST 3: SettingsModel -> SettingsView con todas las filas agrupadas")
+    print("="*70)
+    
+    app = QApplication.instance() or QApplication(sys.argv)
+    
+    model = SettingsModel()
+    model.set_lineas_credito(pd.DataFrame({
+        "NIT": ["900-123-456", "900234567"],
+        "Contraparte": ["Empresa Alpha", "Empresa Beta"],
+        "Grupo Conectado de Contrapartes": ["Grupo Financiero A", "Grupo Financiero B"],
+    }))
+    
+    view = SettingsView(settings_model=model)
+    view.mostrar_lineas_credito(model.lineas_credito_df)
+    
+    tabla = view.tblLineasCredito.model()
+    print(f"\n   Filas en la tabla: {tabla.rowCount()}")
+    
+    assert tabla.rowCount() == 2, f"Se esperaban 2 filas, se obtuvieron {tabla.rowCount()}"
+    assert tabla.data(tabla.index(1, 2)) == "Grupo Financiero B"
+    
+    print("\n[OK] TEST 3 PASADO: el catálogo agrupado se muestra completo")
+
+
+if __name__ == "__main__":
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    
+    test_model_columnas_y_filas()
+    test_settings_view_usa_modelo()
+    test_catalogo_agrupado_desde_settings_model()